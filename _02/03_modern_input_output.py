@@ -8,7 +8,37 @@ Python 3.10+ features
 
 from pathlib import Path
 from datetime import datetime
+import csv
+import io
 import json
+import math
+import re
+import time
+from typing import NamedTuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
 
 # ============================================================================
 # 1. СУЧАСНІ F-STRINGS ТА DEBUGGING
@@ -91,6 +121,49 @@ print(f"Розпарсені: {parsed}")
 print(f"Тип: {type(parsed)}")
 
 
+def parse_csv_file(source):
+    """
+    Парсить весь CSV з колонками name,age,city,salary за один виклик
+    
+    Для файлів parse_csv_row у циклі повільний: split і dict на кожен рядок
+    у Python. pd.read_csv парсить увесь буфер у C і одразу приводить типи.
+    
+    Args:
+        source: Шлях до файлу або file-like об'єкт (з рядком заголовка)
+    
+    Returns:
+        pd.DataFrame (або list[dict], якщо pandas не встановлено)
+    """
+    if HAS_PANDAS:
+        return pd.read_csv(
+            source,
+            dtype={'name': str, 'age': 'int64', 'city': str, 'salary': 'float64'}
+        )
+    
+    if isinstance(source, (str, Path)):
+        with open(source, newline='', encoding='utf-8') as f:
+            return parse_csv_file(f)
+    
+    return [
+        {
+            'name': row['name'],
+            'age': int(row['age']),
+            'city': row['city'],
+            'salary': float(row['salary'])
+        }
+        for row in csv.DictReader(source)
+    ]
+
+
+csv_text = """name,age,city,salary
+Alice,28,Lviv,45000
+Bob,35,Kyiv,62000
+Olena,41,Odesa,58000
+"""
+table = parse_csv_file(io.StringIO(csv_text))
+print(f"\nВесь файл одним викликом: {len(table)} рядки, тип: {type(table).__name__}")
+
+
 # ============================================================================
 # 3. DATA VALIDATION - ПРИКЛАДНИЙ ПРИКЛАД
 # ============================================================================
@@ -111,21 +184,29 @@ def validate_age(age: int | str) -> tuple[bool, int | None, str]:
         
     Note:
         Використовує | для union types (Python 3.10+)
+        Рядок спершу перевіряємо через isdecimal(): виняток у CPython
+        дорогий, а невалідних рядків у сирих даних багато. Приймається
+        те саме, що й int() - рядки з '_' ("1_000") перевіряє сам int()
     """
+    if isinstance(age, str):
+        age = age.strip()
+        digits = age[1:] if age.startswith(('-', '+')) else age
+        if not digits.isdecimal() and '_' not in digits:
+            return False, None, "Вік повинен бути числом"
+    
     try:
         age_int = int(age)
-        
-        if age_int < 0:
-            return False, None, "Вік не може бути від'ємним"
-        elif age_int > 150:
-            return False, None, "Вік занадто великий"
-        elif age_int < 18:
-            return False, age_int, "Потрібно бути 18+"
-        else:
-            return True, age_int, "Валідний вік"
-            
     except ValueError:
         return False, None, "Вік повинен бути числом"
+    
+    if age_int < 0:
+        return False, None, "Вік не може бути від'ємним"
+    elif age_int > 150:
+        return False, None, "Вік занадто великий"
+    elif age_int < 18:
+        return False, age_int, "Потрібно бути 18+"
+    else:
+        return True, age_int, "Валідний вік"
 
 
 # Тестування
@@ -145,36 +226,101 @@ print("\n" + "=" * 70)
 print("4. РОБОТА З JSON (типові DS/DE операції)")
 print("=" * 70)
 
+_iso_cache = {'second': -1, 'iso': ''}
+
+
+def _current_iso_timestamp() -> str:
+    """
+    ISO-timestamp з точністю до секунди
+    
+    datetime.now().isoformat() на кожен запис - це створення об'єкта
+    і форматування рядка. Тут форматуємо лише раз на секунду,
+    а всі записи в межах цієї секунди отримують готовий рядок.
+    """
+    now = int(time.time())
+    if now != _iso_cache['second']:
+        _iso_cache['second'] = now
+        _iso_cache['iso'] = datetime.fromtimestamp(now).isoformat()
+    return _iso_cache['iso']
+
+
+class DataRecord(NamedTuple):
+    """
+    Запис даних для ML pipeline
+    
+    NamedTuple - це tuple з іменованими полями: без __dict__ і хеш-таблиці
+    на кожен екземпляр, тож мільйони записів займають значно менше пам'яті,
+    ніж мільйони словників
+    """
+    user_id: int
+    features: 'np.ndarray | list[float]'
+    label: str
+    timestamp: str
+    version: str = '1.0'
+    metadata: dict | None = None
+    
+    def to_dict(self) -> dict:
+        """Словник для JSON (metadata лише якщо задано)"""
+        record = self._asdict()
+        if not self.metadata:
+            del record['metadata']
+        return record
+
+
 def create_data_record(
     user_id: int,
     features: list[float],
     label: str,
-    metadata: dict | None = None
-) -> dict:
+    metadata: dict | None = None,
+    timestamp: str | None = None
+) -> DataRecord:
     """
     Створює запис даних для ML pipeline
     
     Args:
         user_id: ID користувача
-        features: Feature vector
+        features: Feature vector (з NumPy зберігається як float32 ndarray:
+                  4 байти на число підряд у пам'яті замість Python float
+                  по 24 байти + вказівник у списку)
         label: Цільова змінна
         metadata: Додаткова інформація
+        timestamp: Готовий ISO-timestamp; для батчу рахуємо його один раз
+                   поза циклом замість datetime.now() на кожен запис
     
     Returns:
-        dict: Структурований запис
-    """
-    record = {
-        'user_id': user_id,
-        'features': features,
-        'label': label,
-        'timestamp': datetime.now().isoformat(),
-        'version': '1.0'
-    }
+        DataRecord: Структурований запис (.to_dict() - для JSON)
+    """
+    if HAS_NUMPY:
+        features = np.asarray(features, dtype=np.float32)
     
-    if metadata:
-        record['metadata'] = metadata
+    return DataRecord(
+        user_id=user_id,
+        features=features,
+        label=label,
+        timestamp=timestamp or _current_iso_timestamp(),
+        metadata=metadata or None
+    )
+
+
+def _json_default(obj):
+    """ndarray -> list для json.dumps (float32 через str: 0.8, а не 0.800000011920929)"""
+    if HAS_NUMPY and isinstance(obj, np.ndarray):
+        return [float(str(v)) for v in obj] if obj.dtype == np.float32 else obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_pretty_json(obj: dict) -> str:
+    """
+    JSON з відступами для логів/звітів
     
-    return record
+    orjson (Rust) серіалізує в рази швидше за стандартний json
+    і напряму пише NumPy-масиви; якщо не встановлено - fallback
+    на json.dumps з тим самим форматом
+    """
+    if HAS_ORJSON:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, option=options).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
 
 
 # Створення прикладу
@@ -186,7 +332,15 @@ record = create_data_record(
 )
 
 print("Створений запис:")
-print(json.dumps(record, indent=2, ensure_ascii=False))
+print(to_pretty_json(record.to_dict()))
+
+# Батч записів: один timestamp на весь батч
+batch_ts = _current_iso_timestamp()
+batch = [
+    create_data_record(user_id=uid, features=[0.1, 0.2], label='negative', timestamp=batch_ts)
+    for uid in range(1002, 1005)
+]
+print(f"Батч: {len(batch)} записи з timestamp {batch_ts}")
 
 
 # ============================================================================
@@ -197,6 +351,17 @@ print("\n" + "=" * 70)
 print("5. ПРОСТИЙ ETL PIPELINE")
 print("=" * 70)
 
+# Таблиця для str.translate: видаляє ',' та '$' за один прохід у C
+_SALARY_STRIP = str.maketrans('', '', ',$')
+# Валюта на початку або в кінці рядка: "USD 5000", "45000 грн"
+# (компілюємо один раз, а не при кожному виклику)
+_CURRENCY_RE = re.compile(r'(?i)^\s*(?:грн|usd)\s*|\s*(?:грн|usd)\s*$')
+# Очищена зарплата у звичайному записі числа, напр. "50000", "1.5k", "2e3"
+_PLAIN_SALARY_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?[kK]?')
+# Для "nan"/"inf": float() їх приймає, але в статистику вони не йдуть
+_NOT_FINITE_MSG = "зарплата має бути скінченним числом"
+
+
 def clean_salary_string(salary_str: str) -> float:
     """
     Очищує та конвертує зарплату з різних форматів
@@ -208,14 +373,16 @@ def clean_salary_string(salary_str: str) -> float:
         45000.0
         >>> clean_salary_string("1.5k USD")
         1500.0
+        >>> clean_salary_string("USD 5000")
+        5000.0
     """
     # Видаляємо все крім цифр, крапки та k
-    cleaned = salary_str.replace(',', '').replace('$', '').replace('грн', '').replace('USD', '').strip()
+    # translate + один regex замість ланцюжка .replace(): менше проміжних рядків
+    cleaned = _CURRENCY_RE.sub('', salary_str.translate(_SALARY_STRIP)).strip()
     
-    # Обробка k (thousands)
-    if 'k' in cleaned.lower():
-        cleaned = cleaned.lower().replace('k', '')
-        return float(cleaned) * 1000
+    # Обробка k (thousands) — lower() один раз замість двох
+    if 'k' in (lowered := cleaned.lower()):
+        return float(lowered.replace('k', '')) * 1000
     
     return float(cleaned)
 
@@ -226,16 +393,29 @@ def transform_salary_data(raw_salaries: list[str]) -> dict:
     
     Returns:
         dict: Статистика по зарплатам
+    
+    Note:
+        З pandas вся колонка чиститься векторизовано (.str-операції в C),
+        без виклику clean_salary_string для кожного рядка.
+        "nan"/"inf" float() розпізнає, але в статистику вони не йдуть:
+        обидві гілки пропускають нескінченні значення з попередженням.
     """
+    if HAS_PANDAS:
+        return _transform_salary_data_vectorized(raw_salaries)
+    
     cleaned_salaries = []
     
     for salary in raw_salaries:
         try:
             cleaned = clean_salary_string(salary)
-            cleaned_salaries.append(cleaned)
         except ValueError as e:
             print(f"⚠️  Помилка обробки '{salary}': {e}")
             continue
+        
+        if not math.isfinite(cleaned):
+            print(f"⚠️  Помилка обробки '{salary}': {_NOT_FINITE_MSG}")
+            continue
+        cleaned_salaries.append(cleaned)
     
     if not cleaned_salaries:
         return {'error': 'Немає валідних даних'}
@@ -249,6 +429,56 @@ def transform_salary_data(raw_salaries: list[str]) -> dict:
     }
 
 
+def _transform_salary_data_vectorized(raw_salaries: list[str]) -> dict:
+    """
+    Та сама логіка, що й у clean_salary_string, але для всієї колонки одразу
+    
+    Валюта знімається тим самим _CURRENCY_RE (лише на початку чи в кінці).
+    Рядки не у простому записі числа (_PLAIN_SALARY_RE) перевіряються через
+    clean_salary_string - тож набір валідних значень і повідомлення
+    про помилки такі самі, як у pure-Python гілці
+    """
+    raw = pd.Series(raw_salaries, dtype=object)
+    cleaned = (
+        raw
+        .str.translate(_SALARY_STRIP)
+        .str.replace(_CURRENCY_RE, '', regex=True)
+        .str.strip()
+    )
+    # Швидкий шлях лише для простого запису числа (з необов'язковим k);
+    # float() приймає цей синтаксис так само, як і astype('float64')
+    is_valid = cleaned.str.fullmatch(_PLAIN_SALARY_RE).fillna(False).astype(bool)
+    numbers = cleaned[is_valid]
+    is_thousands = numbers.str.endswith(('k', 'K'))
+    parsed = numbers.str.rstrip('kK').astype('float64')
+    values = pd.Series(float('nan'), index=raw.index)
+    values[is_valid] = parsed.where(~is_thousands, parsed * 1000)
+    
+    errors = {}
+    for idx in raw.index[~is_valid]:
+        try:
+            values[idx] = clean_salary_string(raw[idx])
+        except ValueError as e:
+            errors[idx] = e
+    
+    # NaN (невалідні рядки та "nan") і ±inf не проходять порівняння
+    is_finite = values.abs() < float('inf')
+    for idx in raw.index[~is_finite]:
+        print(f"⚠️  Помилка обробки '{raw[idx]}': {errors.get(idx, _NOT_FINITE_MSG)}")
+    
+    valid = values[is_finite]
+    if valid.empty:
+        return {'error': 'Немає валідних даних'}
+    
+    return {
+        'count': int(valid.size),
+        'min': float(valid.min()),
+        'max': float(valid.max()),
+        'avg': float(valid.mean()),
+        'total': float(valid.sum())
+    }
+
+
 # Тестування з реальними даними
 raw_data = [
     "$50,000",
@@ -277,6 +507,10 @@ print("\n" + "=" * 70)
 print("6. PATHLIB - СУЧАСНИЙ СПОСІБ (замість os.path)")
 print("=" * 70)
 
+# Робоча директорія на момент запуску (для каталогізації тисяч файлів)
+_CWD = Path.cwd()
+
+
 def get_data_file_info(filename: str) -> dict:
     """
     Отримує інформацію про файл даних
@@ -289,16 +523,18 @@ def get_data_file_info(filename: str) -> dict:
     """
     # Pathlib - сучасний спосіб (Python 3.4+)
     filepath = Path(filename)
+    suffix = filepath.suffix
     
     return {
         'filename': filepath.name,
-        'extension': filepath.suffix,
+        'extension': suffix,
         'stem': filepath.stem,  # Назва без розширення
         'parent': str(filepath.parent),
-        'absolute': str(filepath.absolute()),
+        # _CWD / path замість .absolute(): без os.getcwd() на кожен файл
+        'absolute': str(_CWD / filepath),
         'exists': filepath.exists(),
-        'is_csv': filepath.suffix == '.csv',
-        'is_json': filepath.suffix == '.json'
+        'is_csv': suffix == '.csv',
+        'is_json': suffix == '.json'
     }
 
 
@@ -330,17 +566,14 @@ def process_data_batch(data: list[int], threshold: int = 100) -> dict:
     
     Walrus operator (:=) дозволяє присвоєння в виразах
     """
-    results = []
-    
     # Старий спосіб:
     # filtered_data = [x for x in data if x > threshold]
     # if len(filtered_data) > 0:
     #     results = filtered_data
     
-    # Новий спосіб з walrus:
-    if (n := len([x for x in data if x > threshold])) > 0:
+    # Новий спосіб з walrus (список фільтруємо лише один раз):
+    if (n := len(results := [x for x in data if x > threshold])) > 0:
         print(f"✅ Знайдено {n} записів > {threshold}")
-        results = [x for x in data if x > threshold]
     else:
         print(f"❌ Немає записів > {threshold}")
     
@@ -367,6 +600,34 @@ print("\n" + "=" * 70)
 print("8. TYPE HINTS (Python 3.5+ / 3.10+ для unions)")
 print("=" * 70)
 
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _metrics_kernel(p, a):
+        """
+        Усі суми для MAE/MSE/R² в одному скомпільованому циклі
+        
+        NumPy робить окремий прохід по пам'яті на кожну операцію
+        (diff, abs, dot...), тут - один прохід + один для ss_tot
+        """
+        n = p.size
+        sum_abs = 0.0
+        sum_sq = 0.0
+        sum_a = 0.0
+        for i in range(n):
+            d = p[i] - a[i]
+            sum_abs += abs(d)
+            sum_sq += d * d
+            sum_a += a[i]
+        
+        mean_a = sum_a / n
+        ss_tot = 0.0
+        for i in range(n):
+            t = a[i] - mean_a
+            ss_tot += t * t
+        
+        return sum_abs / n, sum_sq, ss_tot
+
+
 def calculate_metrics(
     predictions: list[int | float],
     actuals: list[int | float]
@@ -388,16 +649,36 @@ def calculate_metrics(
     if len(predictions) != len(actuals):
         raise ValueError("Різна кількість елементів")
     
-    # Mean Absolute Error
-    mae = sum(abs(p - a) for p, a in zip(predictions, actuals)) / len(predictions)
-    
-    # Mean Squared Error
-    mse = sum((p - a) ** 2 for p, a in zip(predictions, actuals)) / len(predictions)
+    if HAS_NUMBA:
+        # JIT-компільоване ядро (перший виклик - компіляція, далі машинний код)
+        mae, ss_res, ss_tot = _metrics_kernel(
+            np.asarray(predictions, dtype=np.float64),
+            np.asarray(actuals, dtype=np.float64)
+        )
+        mse = ss_res / len(predictions)
+    elif HAS_NUMPY:
+        # Векторизований варіант: одна різниця p - a, далі все в C (SIMD)
+        p = np.asarray(predictions, dtype=np.float64)
+        a = np.asarray(actuals, dtype=np.float64)
+        # Один тимчасовий буфер на всю функцію: abs і центрування пишемо в нього
+        diff = p - a
+        ss_res = float(np.dot(diff, diff))  # Σ(p - a)² одним проходом
+        mae = float(np.abs(diff, out=diff).mean())
+        mse = ss_res / diff.size
+        centered = np.subtract(a, a.mean(), out=diff)
+        ss_tot = float(np.dot(centered, centered))
+    else:
+        # Mean Absolute Error
+        mae = sum(abs(p - a) for p, a in zip(predictions, actuals)) / len(predictions)
+        
+        # Mean Squared Error
+        mse = sum((p - a) ** 2 for p, a in zip(predictions, actuals)) / len(predictions)
+        
+        # R² Score (simplified)
+        mean_actual = sum(actuals) / len(actuals)
+        ss_tot = sum((a - mean_actual) ** 2 for a in actuals)
+        ss_res = sum((a - p) ** 2 for a, p in zip(actuals, predictions))
     
-    # R² Score (simplified)
-    mean_actual = sum(actuals) / len(actuals)
-    ss_tot = sum((a - mean_actual) ** 2 for a in actuals)
-    ss_res = sum((a - p) ** 2 for a, p in zip(actuals, predictions))
     r2 = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0.0
     
     return {
@@ -441,10 +722,13 @@ def check_data_quality(data: dict[str, list]) -> dict:
         'columns': {}
     }
     
+    if HAS_PANDAS and data:
+        report['columns'] = _column_quality_vectorized(data)
+        return report
+    
     for column_name, values in data.items():
         # Підрахунок missing values
-        none_count = values.count(None)
-        empty_count = sum(1 for v in values if v == '')
+        none_count, empty_count, unique_count = _scan_column(values)
         missing_count = none_count + empty_count
         
         # Статистика
@@ -453,12 +737,66 @@ def check_data_quality(data: dict[str, list]) -> dict:
             'missing': missing_count,
             'missing_pct': (missing_count / len(values) * 100) if values else 0,
             'filled': len(values) - missing_count,
-            'unique': len(set(v for v in values if v not in [None, '']))
+            'unique': unique_count
         }
     
     return report
 
 
+def _scan_column(values: list) -> tuple[int, int, int]:
+    """
+    Один прохід по колонці: (кількість None, кількість '', унікальних)
+    
+    Замість трьох окремих проходів (count, генератор, set) -
+    всі лічильники оновлюються за одне читання списку
+    """
+    none_count = empty_count = 0
+    seen = set()
+    for v in values:
+        if v is None:
+            none_count += 1
+        elif v == '':
+            empty_count += 1
+        else:
+            seen.add(v)
+    return none_count, empty_count, len(seen)
+
+
+def _column_quality_vectorized(data: dict[str, list]) -> dict:
+    """
+    Колонкові isna/nunique у pandas замість Python-проходів на колонку
+    
+    Кожна колонка - окрема Series, тож різна довжина колонок дозволена,
+    як і в _scan_column. Пропуск - лише None або '': якщо isna() знайшов
+    NaN/NA/NaT, рахуємо колонку через _scan_column, щоб правила збігались
+    """
+    columns = {}
+    for column_name, values in data.items():
+        series = pd.Series(values, dtype=object)
+        na_mask = series.isna()
+        
+        if any(v is not None for v in series[na_mask]):
+            none_count, empty_count, unique_count = _scan_column(values)
+        else:
+            filled = series[~na_mask]
+            empty_mask = filled == ''
+            none_count = int(na_mask.sum())
+            empty_count = int(empty_mask.sum())
+            unique_count = int(filled[~empty_mask].nunique())
+        
+        total = len(values)
+        missing_count = none_count + empty_count
+        columns[column_name] = {
+            'total': total,
+            'missing': missing_count,
+            'missing_pct': (missing_count / total * 100) if total else 0,
+            'filled': total - missing_count,
+            'unique': unique_count
+        }
+    
+    return columns
+
+
 # Приклад з реальними даними
 dataset = {
     'user_id': [1, 2, 3, 4, 5],
@@ -504,8 +842,11 @@ def process_data_with_logging(data: list[int]) -> dict:
     Обробляє дані з професійним логуванням
     
     Замість print() використовуємо logging для production code
+    
+    Аргументи передаємо через %s, а не f-string: рядок форматується
+    лише якщо рівень INFO увімкнено
     """
-    logger.info(f"Початок обробки {len(data)} записів")
+    logger.info("Початок обробки %d записів", len(data))
     
     # Валідація
     if not data:
@@ -519,11 +860,11 @@ def process_data_with_logging(data: list[int]) -> dict:
             'sum': sum(data),
             'avg': sum(data) / len(data)
         }
-        logger.info(f"Оброблено успішно. Середнє: {result['avg']:.2f}")
+        logger.info("Оброблено успішно. Середнє: %.2f", result['avg'])
         return result
         
     except Exception as e:
-        logger.error(f"Помилка обробки: {e}")
+        logger.error("Помилка обробки: %s", e)
         raise
 
 
@@ -557,7 +898,7 @@ summary = """
    path = Path("data.csv")
 
 ✅ Logging замість print для production:
-   logger.info("Processing data...")
+   logger.info("Processing %d rows", n)  # lazy formatting, не f-string
 
 ✅ Data validation patterns:
    - Return tuple (is_valid, value, message)
@@ -6,12 +6,19 @@ Advanced function patterns для Data Science/Engineering
 Python 3.10+ features
 """
 
-from functools import wraps, lru_cache, partial
+from functools import wraps, cache, partial
+from itertools import islice
 from time import time, sleep
 from typing import Callable, Any
 from dataclasses import dataclass
 import statistics
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # ============================================================================
 # 1. ДЕКОРАТОРИ - TIMING ДЛЯ DATA PIPELINES
 # ============================================================================
@@ -92,18 +99,22 @@ avg = calculate_average([10, 20, 30, 40, 50])
 # ============================================================================
 
 print("\n" + "=" * 70)
-print("3. LRU CACHE - ОПТИМІЗАЦІЯ ДОРОГИХ ОБЧИСЛЕНЬ")
+print("3. CACHE - ОПТИМІЗАЦІЯ ДОРОГИХ ОБЧИСЛЕНЬ")
 print("=" * 70)
 
-@lru_cache(maxsize=128)
+@cache
 def expensive_calculation(n: int) -> int:
     """
     Дорога операція з кешуванням
     
-    lru_cache кешує результати - критично для:
+    cache кешує результати - критично для:
     - Feature engineering
     - Повторювані обчислення в ML
     - API calls
+    
+    @cache (Python 3.9+) = lru_cache(maxsize=None): без LRU-списку,
+    тому кеш-хіт дешевший. @lru_cache(maxsize=N) потрібен, лише коли
+    треба обмежити пам'ять (багато унікальних аргументів).
     """
     print(f"  🔄 Обчислюю для {n}... (це дорого!)")
     sleep(0.1)  # Симуляція важкої операції
@@ -170,24 +181,27 @@ def process_data_stream(data_generator, batch_size: int = 100):
     """
     Обробляє дані батчами з генератора
     Типовий паттерн для ML training
+    
+    islice відрізає з ітератора одразу batch_size елементів (у C),
+    без append і перевірки len(batch) на кожен елемент.
+    Один новий список на батч - свідомий вибір: алокація амортизується
+    на batch_size елементів, а споживач може безпечно зберегти батч
+    (спільний буфер перезаписувався б наступною ітерацією)
     """
-    batch = []
+    iterator = iter(data_generator)
     processed = 0
     
-    for item in data_generator:
-        batch.append(item)
-        
-        if len(batch) >= batch_size:
-            # Обробка батчу
-            batch_sum = sum(batch)
-            processed += len(batch)
-            print(f"  Оброблено батч: {len(batch)} елементів, сума: {batch_sum}")
-            batch = []
-    
-    # Обробка останнього батчу
-    if batch:
+    while batch := list(islice(iterator, batch_size)):
         processed += len(batch)
-        print(f"  Останній батч: {len(batch)} елементів")
+        
+        # Обробка останнього (неповного) батчу
+        if len(batch) < batch_size:
+            print(f"  Останній батч: {len(batch)} елементів")
+            break
+        
+        # Обробка батчу
+        batch_sum = sum(batch)
+        print(f"  Оброблено батч: {len(batch)} елементів, сума: {batch_sum}")
     
     return processed
 
@@ -247,6 +261,39 @@ for data in test_cases:
     print(f"  {result}")
 
 
+# Коли всі гілки відрізняються лише значенням одного ключа ("type"),
+# match перебирає case-шаблони по черзі, а словник знаходить гілку одразу
+_ROUTES: dict[str, Callable[[dict], str]] = {
+    "csv": lambda d: f"📄 Обробка CSV: {d['path']}",
+    "json": lambda d: f"📋 Обробка JSON: {d['path']} ({d['encoding']})",
+    "parquet": lambda d: f"🗂️  Обробка Parquet: {d['path']}",
+    "api": lambda d: f"🌐 API запит: {d['method']} {d['url']}",
+}
+
+
+def route_data_by_type_dispatch(data: dict) -> str:
+    """
+    Той самий роутинг через dispatch-таблицю (один hash lookup)
+    
+    match-case читабельніший для складних структур,
+    dispatch-таблиця - швидша для гарячого шляху з простим ключем
+    """
+    type_name = data.get("type")
+    if not isinstance(type_name, str):
+        return "❌ Невалідні дані"
+    
+    handler = _ROUTES.get(type_name)
+    try:
+        return handler(data) if handler else f"⚠️  Невідомий тип: {type_name}"
+    except KeyError:
+        # Як і в match: без обов'язкових полів шаблон "не підходить"
+        return f"⚠️  Невідомий тип: {type_name}"
+
+
+same = all(route_data_by_type(d) == route_data_by_type_dispatch(d) for d in test_cases)
+print(f"\nDispatch-таблиця дає ті самі результати: {same}")
+
+
 def process_ml_result(result: dict) -> str:
     """
     Обробка результатів ML моделі з pattern matching
@@ -288,7 +335,7 @@ print("\n" + "=" * 70)
 print("6. DATACLASSES - СУЧАСНІ DATA STRUCTURES")
 print("=" * 70)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatasetInfo:
     """
     Інформація про датасет
@@ -297,12 +344,17 @@ class DatasetInfo:
     - __init__
     - __repr__
     - __eq__
+    
+    slots=True (Python 3.10+) - без __dict__: менше пам'яті на екземпляр
+    і швидший доступ до атрибутів; frozen=True - незмінний запис.
+    features - tuple, а не list: frozen генерує __hash__ по всіх полях,
+    і hash() зі списком усередині впав би з TypeError
     """
     name: str
     rows: int
     columns: int
     size_mb: float
-    features: list[str]
+    features: tuple[str, ...]
     
     @property
     def density(self) -> float:
@@ -320,14 +372,14 @@ dataset = DatasetInfo(
     rows=100_000,
     columns=25,
     size_mb=12.5,
-    features=["age", "tenure", "monthly_charges", "churn"]
+    features=("age", "tenure", "monthly_charges", "churn")
 )
 
 print(f"Dataset: {dataset}")
 print(f"Summary: {dataset.summary()}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MLModelMetrics:
     """Метрики ML моделі"""
     model_name: str
@@ -415,6 +467,15 @@ result = list(
 )
 print(f"  Category A зі збільшенням: {result}")
 
+# Vectorized - той самий ланцюг над колонками (SoA замість списку словників)
+if HAS_NUMPY:
+    print("\nVECTORIZED - NumPy колонки:")
+    values = np.fromiter((x["value"] for x in raw_data), dtype=np.float64, count=len(raw_data))
+    categories = np.array([x["category"] for x in raw_data])
+    # Один векторний compare + один multiply замість lambda на кожен запис
+    vectorized = values[categories == "A"] * 1.1
+    print(f"  Category A зі збільшенням: {vectorized.tolist()}")
+
 
 # ============================================================================
 # 8. PARTIAL FUNCTIONS - СПЕЦІАЛІЗАЦІЯ ФУНКЦІЙ
@@ -460,12 +521,47 @@ class DataValidationError(Exception):
     pass
 
 
+_MISSING = object()
+
+
+def _validation_error(record: dict) -> str | None:
+    """Повертає текст помилки або None, якщо запис валідний"""
+    # Валідація структури
+    value = record.get("value", _MISSING)
+    if value is _MISSING:
+        return "Missing 'value' field"
+    
+    # Валідація типу
+    if not isinstance(value, (int, float)):
+        return "'value' must be numeric"
+    
+    # Валідація діапазону
+    if value < 0:
+        return "'value' must be positive"
+    
+    return None
+
+
+def validate_record(record: dict) -> dict:
+    """
+    Валідує один запис (fail fast): кидає DataValidationError
+    Зручно, коли невалідний запис - справді виняткова ситуація
+    """
+    if (error := _validation_error(record)) is not None:
+        raise DataValidationError(error)
+    return record
+
+
 def validate_and_process(
     data: list[dict]
 ) -> tuple[list[dict], list[str]]:
     """
     Валідує та обробляє дані з proper error handling
     
+    У батчі невалідні записи - звичайна ситуація, а raise/except на кожен
+    з них дорогий (створення винятку + traceback). Тому очікувані помилки
+    збираємо як значення, а try/except лишаємо лише для неочікуваних.
+    
     Returns:
         tuple: (valid_data, errors)
     """
@@ -474,23 +570,13 @@ def validate_and_process(
     
     for i, record in enumerate(data):
         try:
-            # Валідація структури
-            if "value" not in record:
-                raise DataValidationError(f"Missing 'value' field")
-            
-            # Валідація типу
-            if not isinstance(record["value"], (int, float)):
-                raise DataValidationError(f"'value' must be numeric")
-            
-            # Валідація діапазону
-            if record["value"] < 0:
-                raise DataValidationError(f"'value' must be positive")
+            if (error := _validation_error(record)) is not None:
+                errors.append(f"Record {i}: {error}")
+                continue
             
             # Валідація пройдена
             valid_data.append(record)
             
-        except DataValidationError as e:
-            errors.append(f"Record {i}: {e}")
         except Exception as e:
             errors.append(f"Record {i}: Unexpected error - {e}")
     
@@ -515,6 +601,12 @@ if errors:
     for error in errors:
         print(f"  ❌ {error}")
 
+# Одиночна перевірка з винятком
+try:
+    validate_record({"id": 6, "value": -1})
+except DataValidationError as e:
+    print(f"\nDataValidationError: {e}")
+
 
 # ============================================================================
 # 10. КОМПОЗИЦІЯ ФУНКЦІЙ - PIPELINE PATTERN
@@ -527,7 +619,16 @@ print("=" * 70)
 def compose(*functions):
     """
     Композиція функцій - функціональний підхід до pipelines
+    
+    Для типових коротких pipelines (2-3 етапи) повертаємо пряму
+    вкладену функцію - без циклу та перезапису result на кожен виклик
     """
+    match functions:
+        case (f, g):
+            return lambda arg: g(f(arg))
+        case (f, g, h):
+            return lambda arg: h(g(f(arg)))
+    
     def inner(arg):
         result = arg
         for func in functions:
@@ -537,25 +638,47 @@ def compose(*functions):
 
 
 # Функції для pipeline
-def extract_values(data: list[dict]) -> list[float]:
-    """Extract: витягуємо значення"""
-    return [item["value"] for item in data if "value" in item]
-
-
-def transform_scale(values: list[float]) -> list[float]:
-    """Transform: нормалізація [0, 1]"""
-    if not values:
-        return []
+def extract_values(data: list[dict]) -> "list[float] | np.ndarray":
+    """
+    Extract: витягуємо значення
+    
+    З NumPy одразу пишемо в float64-масив (np.fromiter) і його ж
+    повертаємо - без проміжного списку Python float-об'єктів
+    """
+    values = (item["value"] for item in data if "value" in item)
+    if HAS_NUMPY:
+        return np.fromiter(values, dtype=np.float64)
+    return list(values)
+
+
+def transform_scale(values: "list[float] | np.ndarray") -> "list[float] | np.ndarray":
+    """Transform: нормалізація [0, 1] (з NumPy - float64-масив)"""
+    if len(values) == 0:
+        return values[:0]
+    if HAS_NUMPY:
+        arr = np.asarray(values, dtype=np.float64)
+        lo, hi = arr.min(), arr.max()
+        if hi == lo:
+            return np.full_like(arr, 0.5)
+        return (arr - lo) / (hi - lo)
     min_val, max_val = min(values), max(values)
     if max_val == min_val:
         return [0.5] * len(values)
     return [(v - min_val) / (max_val - min_val) for v in values]
 
 
-def load_statistics(values: list[float]) -> dict:
-    """Load: обчислюємо статистику"""
-    if not values:
+def load_statistics(values: "list[float] | np.ndarray") -> dict:
+    """Load: обчислюємо статистику (у Python float лише на виході)"""
+    if len(values) == 0:
         return {"error": "No data"}
+    if HAS_NUMPY:
+        arr = np.asarray(values, dtype=np.float64)
+        return {
+            "count": int(arr.size),
+            "mean": float(arr.mean()),
+            "median": float(np.median(arr)),
+            "stdev": float(arr.std(ddof=1)) if arr.size > 1 else 0
+        }
     return {
         "count": len(values),
         "mean": statistics.mean(values),
@@ -599,7 +722,7 @@ print("=" * 70)
 summary = """
 ✅ ДЕКОРАТОРИ:
    - @timing_decorator - профілювання
-   - @lru_cache - оптимізація
+   - @cache / @lru_cache - оптимізація
    - @log_calls - debugging
 
 ✅ ГЕНЕРАТОРИ:
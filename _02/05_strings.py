@@ -242,10 +242,16 @@ def find_letter_loop(text, letter):
     Returns:
         list: Список позицій де знайдено літеру
     """
+    if len(letter) != 1:
+        return []  # Шукаємо саме один символ
+    
+    # find(letter, start) шукає в C і одразу стрибає до наступного входження,
+    # а text[i] у циклі for створює новий рядок-символ на кожній позиції
     positions = []
-    for i in range(len(text)):
-        if text[i] == letter:
-            positions.append(i)
+    i = text.find(letter)
+    while i != -1:
+        positions.append(i)
+        i = text.find(letter, i + 1)
     return positions
 
 positions = find_letter_loop("Hello World", "o")
@@ -264,15 +270,27 @@ def count_letter(text, letter):
     Returns:
         int: Кількість входжень
     """
+    target = letter.lower()  # Рахуємо один раз, а не на кожен символ
+    
+    # ASCII: lower() змінює лише A-Z і довжину рядка не змінює, тож
+    # lower() + count() у C дають те саме, що й Python-цикл нижче
+    # (чому не два count() - див. count_letter_method)
+    if len(letter) == 1 and letter.isascii() and text.isascii():
+        return text.lower().count(target)
+    
     count = 0
     for char in text:
-        if char.lower() == letter.lower():
+        if char.lower() == target:
             count += 1
     return count
 
 # Або простіше через метод:
 def count_letter_method(text, letter):
     """Рахує літери через метод count()"""
+    # Варіант text.count('l') + text.count('L') обходиться без копії рядка,
+    # але два проходи count() повільніші за lower() + один count()
+    # (lower() для ASCII дуже швидкий), і для не-ASCII тексту він не
+    # рахує символи, які lower() перетворює на цю літеру. Тому lower().
     return text.lower().count(letter.lower())
 
 text = "Hello World"
@@ -283,9 +301,9 @@ print(f"Літера 'l' зустрічається {count_letter_method(text, '
 # Приклад 4: Перетворення до великої літери
 def to_uppercase(text):
     """Перетворює перший символ на велику літеру"""
-    if len(text) == 0:
-        return text
-    return text[0].upper() + text[1:]
+    # Зріз [:1] для порожнього рядка - теж порожній рядок,
+    # тож окрема перевірка len(text) == 0 не потрібна
+    return text[:1].upper() + text[1:]
 
 print(f"'hello' -> '{to_uppercase('hello')}'")
 
@@ -296,11 +314,9 @@ print(f"'hello' -> '{'hello'.capitalize()}'")
 # Приклад 5: Всі слова з великої літери
 def title_case(text):
     """Кожне слово з великої літери"""
-    words = text.split()
-    capitalized = []
-    for word in words:
-        capitalized.append(word.capitalize())
-    return " ".join(capitalized)
+    # map викликає capitalize у C, без Python-циклу та append на кожне слово.
+    # На відміну від text.title(), "python's" -> "Python's" (а не "Python'S")
+    return " ".join(map(str.capitalize, text.split()))
 
 text = "привіт світ python"
 print(f"Title case: {title_case(text)}")
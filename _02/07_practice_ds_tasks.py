@@ -7,9 +7,65 @@ Real-world Data Science/Engineering challenges
 
 from typing import Any
 import json
-from datetime import datetime
+import re
+from array import array
+from collections import defaultdict
+from datetime import date, datetime
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class NumericSeries:
+    """
+    Числовий ряд, що один раз конвертується в float64-масив
+    
+    Числові функції нижче всередині роблять np.asarray(values) - для list
+    це щоразу новий прохід з розпаковкою кожного float. NumericSeries
+    кешує масив (np.asarray бере його через __array__ без копії, як
+    read-only view), а для pure-Python коду поводиться як звичайний
+    список (len, ітерація, індекси)
+    """
+    
+    __slots__ = ('values', '_array')
+    
+    def __init__(self, values: list[float]):
+        self.values = values
+        self._array = None
+    
+    @property
+    def array(self) -> "np.ndarray":
+        if self._array is None:
+            self._array = np.asarray(self.values, dtype=np.float64)
+        return self._array
+    
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and np.dtype(dtype) != np.float64:
+            if copy is False:
+                raise ValueError("Зміна dtype NumericSeries потребує копії")
+            return self.array.astype(dtype)
+        if copy:
+            return self.array.copy()
+        # Кеш віддаємо лише для читання, щоб запис у результат
+        # np.asarray не змінював ряд для наступних викликів
+        view = self.array.view()
+        view.setflags(write=False)
+        return view
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __iter__(self):
+        return iter(self.values)
+    
+    def __getitem__(self, index):
+        return self.values[index]
+
 # ============================================================================
 # БЛОК 1: DATA CLEANING & VALIDATION
 # ============================================================================
@@ -22,6 +78,11 @@ print("=" * 70)
 # Завдання 1.1: Email Validator
 # ----------------------------------------------------------------------------
 
+# Рівно один @, непорожня local-частина, у домені є крапка.
+# Компілюємо один раз; валідний email перевіряється одним проходом
+_EMAIL_RE = re.compile(r'[^@]+@[^@]*\.[^@]*')
+
+
 def validate_email(email: str) -> tuple[bool, str]:
     """
     Валідує email адресу
@@ -45,7 +106,11 @@ def validate_email(email: str) -> tuple[bool, str]:
     """
     # TODO: Реалізуйте валідацію
     
-    # Базова перевірка
+    # Швидкий шлях: більшість адрес валідні
+    if _EMAIL_RE.fullmatch(email):
+        return True, "Valid email"
+    
+    # Далі - лише для невалідних: з'ясовуємо причину
     if '@' not in email:
         return False, "Missing @ symbol"
     
@@ -110,31 +175,38 @@ def check_missing_values(data: list[dict]) -> dict[str, Any]:
     if not data:
         return {"error": "Empty dataset"}
     
-    # Отримуємо всі унікальні ключі
-    all_keys = set()
+    # Отримуємо всі унікальні ключі (dict зберігає порядок появи, set - ні)
+    all_keys = {}
     for record in data:
-        all_keys.update(record.keys())
+        for key in record:
+            if key not in all_keys:
+                all_keys[key] = None
     
-    # Аналіз по кожній колонці
-    columns_stats = {}
+    # Один прохід по рядках (row-major): кожен record читаємо лише раз,
+    # а не по разу на кожну колонку. Лічильники: [present, None, '']
+    counters = {key: [0, 0, 0] for key in all_keys}
     
-    for key in all_keys:
-        missing = 0
-        none_count = 0
-        empty_string = 0
-        
-        for record in data:
-            value = record.get(key)
+    for record in data:
+        for key, value in record.items():
+            counter = counters[key]
+            counter[0] += 1
             if value is None:
-                missing += 1
-                none_count += 1
+                counter[1] += 1
             elif value == '':
-                missing += 1
-                empty_string += 1
+                counter[2] += 1
+    
+    # Аналіз по кожній колонці
+    columns_stats = {}
+    n_rows = len(data)
+    
+    for key, (present, none_count, empty_string) in counters.items():
+        # Відсутній у записі ключ теж рахується як None (як record.get)
+        none_count += n_rows - present
+        missing = none_count + empty_string
         
         columns_stats[key] = {
             'total_missing': missing,
-            'missing_pct': (missing / len(data)) * 100,
+            'missing_pct': (missing / n_rows) * 100,
             'none_count': none_count,
             'empty_string': empty_string
         }
@@ -195,9 +267,12 @@ def normalize_numerical_data(values: list[float]) -> list[float]:
     """
     # TODO: Реалізуйте Min-Max normalization
     
-    if not values:
+    if len(values) == 0:
         return []
     
+    if HAS_NUMPY:
+        return normalize_numerical_data_fast(values).tolist()
+    
     min_val = min(values)
     max_val = max(values)
     
@@ -209,6 +284,29 @@ def normalize_numerical_data(values: list[float]) -> list[float]:
     return normalized
 
 
+def normalize_numerical_data_fast(values: list[float]) -> "np.ndarray | array":
+    """
+    Те саме, що normalize_numerical_data, але повертає суцільний
+    float64-буфер (np.ndarray, без NumPy - array('d')) замість list
+    
+    У list кожне значення - окремий float-об'єкт (~24 байти + вказівник),
+    у буфері - 8 байт. Для коду, який лише ітерує чи передає дані далі
+    (в NumPy, у файл), .tolist() зайвий
+    """
+    if not HAS_NUMPY:
+        return array('d', normalize_numerical_data(values))
+    
+    # Віднімання і ділення - векторизовані, без float-об'єкта на елемент
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return arr
+    min_val = arr.min()
+    max_val = arr.max()
+    if max_val == min_val:
+        return np.full_like(arr, 0.5)  # Всі однакові
+    return (arr - min_val) / (max_val - min_val)
+
+
 # Тест
 print("\n--- Завдання 2.1: Data Normalizer ---")
 raw_values = [10, 25, 50, 75, 100]
@@ -218,6 +316,10 @@ print("Оригінал → Нормалізовані:")
 for orig, norm in zip(raw_values, normalized):
     print(f"  {orig:6.1f} → {norm:.3f}")
 
+normalized_buffer = normalize_numerical_data_fast(raw_values)
+print(f"Fast-версія ({type(normalized_buffer).__name__}): "
+      f"{list(normalized_buffer) == normalized}")
+
 
 # ----------------------------------------------------------------------------
 # Завдання 2.2: Feature Engineering
@@ -245,6 +347,16 @@ def create_age_groups(ages: list[int]) -> dict[str, list[int]]:
     """
     # TODO: Реалізуйте binning
     
+    if HAS_NUMPY:
+        # Індекс групи без розгалужень: сума булевих порівнянь з межами
+        # (< 18 -> 0, <= 35 -> 1, <= 55 -> 2, інакше -> 3)
+        arr = np.asarray(ages, dtype=np.float64)
+        group_idx = 3 - (arr <= 55) - (arr <= 35) - (arr < 18)
+        return {
+            name: [ages[i] for i in np.flatnonzero(group_idx == k)]
+            for k, name in enumerate(('youth', 'young_adult', 'adult', 'senior'))
+        }
+    
     groups = {
         'youth': [],
         'young_adult': [],
@@ -307,11 +419,28 @@ def calculate_statistics(numbers: list[float]) -> dict[str, float]:
     """
     # TODO: Реалізуйте обчислення статистики
     
-    if not numbers:
+    if len(numbers) == 0:
         return {"error": "Empty list"}
     
     n = len(numbers)
     
+    if HAS_NUMPY:
+        # Один float64-буфер, усі агрегати - векторизовані редукції в C
+        arr = np.asarray(numbers, dtype=np.float64)
+        variance = float(arr.var())
+        min_val = float(arr.min())
+        max_val = float(arr.max())
+        return {
+            'count': n,
+            'mean': float(arr.mean()),
+            'median': float(np.median(arr)),
+            'std': variance ** 0.5,
+            'variance': variance,
+            'min': min_val,
+            'max': max_val,
+            'range': max_val - min_val
+        }
+    
     # Mean
     mean = sum(numbers) / n
     
@@ -379,18 +508,26 @@ def detect_outliers_iqr(data: list[float]) -> dict[str, Any]:
     """
     # TODO: Реалізуйте IQR метод
     
-    if not data:
+    if len(data) == 0:
         return {"error": "Empty data"}
     
-    sorted_data = sorted(data)
-    n = len(sorted_data)
+    n = len(data)
     
     # Calculate Q1 and Q3
     q1_idx = n // 4
     q3_idx = 3 * n // 4
     
-    q1 = sorted_data[q1_idx]
-    q3 = sorted_data[q3_idx]
+    if HAS_NUMPY:
+        arr = np.asarray(data, dtype=np.float64)
+        # argpartition (introselect, O(n)) замість повного сортування:
+        # потрібні лише дві порядкові статистики
+        order = np.argpartition(arr, [q1_idx, q3_idx])
+        q1 = data[order[q1_idx]]
+        q3 = data[order[q3_idx]]
+    else:
+        sorted_data = sorted(data)
+        q1 = sorted_data[q1_idx]
+        q3 = sorted_data[q3_idx]
     
     iqr = q3 - q1
     
@@ -398,8 +535,14 @@ def detect_outliers_iqr(data: list[float]) -> dict[str, Any]:
     upper_bound = q3 + 1.5 * iqr
     
     # Find outliers
-    outliers = [x for x in data if x < lower_bound or x > upper_bound]
-    normal = [x for x in data if lower_bound <= x <= upper_bound]
+    if HAS_NUMPY:
+        # Одна булева маска замість двох проходів по списку
+        is_outlier = (arr < lower_bound) | (arr > upper_bound)
+        outliers = [data[i] for i in np.flatnonzero(is_outlier)]
+        normal_count = n - len(outliers)
+    else:
+        outliers = [x for x in data if x < lower_bound or x > upper_bound]
+        normal_count = n - len(outliers)
     
     return {
         'q1': q1,
@@ -410,7 +553,7 @@ def detect_outliers_iqr(data: list[float]) -> dict[str, Any]:
         'outliers': outliers,
         'outlier_count': len(outliers),
         'outlier_percentage': (len(outliers) / len(data)) * 100,
-        'normal_count': len(normal)
+        'normal_count': normal_count
     }
 
 
@@ -429,6 +572,14 @@ print(f"  IQR: {outlier_analysis['iqr']}")
 print(f"  Bounds: [{outlier_analysis['lower_bound']:.1f}, {outlier_analysis['upper_bound']:.1f}]")
 print(f"  Outliers: {outlier_analysis['outliers']} ({outlier_analysis['outlier_percentage']:.1f}%)")
 
+# Кілька функцій над тими самими даними: конвертуємо в масив один раз
+series = NumericSeries(test_data)
+same_results = (
+    calculate_statistics(series) == calculate_statistics(test_data)
+    and detect_outliers_iqr(series) == outlier_analysis
+)
+print(f"  NumericSeries дає ті самі результати: {same_results}")
+
 
 # ============================================================================
 # БЛОК 4: TIME SERIES BASICS
@@ -467,12 +618,20 @@ def calculate_moving_average(values: list[float], window: int) -> list[float]:
     if len(values) < window:
         return []
     
-    moving_averages = []
+    # Сума вікна = різниця двох префіксних сум: O(n) замість O(n * window)
+    if HAS_NUMPY:
+        cumsum = np.cumsum(np.asarray(values, dtype=np.float64))
+        window_sums = cumsum[window - 1:].copy()
+        window_sums[1:] -= cumsum[:-window]
+        return (window_sums / window).tolist()
+    
+    # Без NumPy - та сама ідея: ковзна сума (+ новий, - той, що вийшов)
+    window_sum = sum(values[:window])
+    moving_averages = [window_sum / window]
     
-    for i in range(len(values) - window + 1):
-        window_values = values[i:i + window]
-        avg = sum(window_values) / window
-        moving_averages.append(avg)
+    for i in range(window, len(values)):
+        window_sum += values[i] - values[i - window]
+        moving_averages.append(window_sum / window)
     
     return moving_averages
 
@@ -513,6 +672,18 @@ def calculate_growth_rates(values: list[float]) -> list[float]:
     if len(values) < 2:
         return []
     
+    if HAS_NUMPY:
+        # Зсунуті зрізи: усі пари (old, new) обробляються одним виразом
+        arr = np.asarray(values, dtype=np.float64)
+        old_values, new_values = arr[:-1], arr[1:]
+        zero_base = old_values == 0
+        growth_rates = np.divide(
+            new_values - old_values, old_values,
+            out=np.zeros_like(old_values), where=~zero_base
+        ) * 100
+        growth_rates[zero_base & (new_values > 0)] = np.inf
+        return growth_rates.tolist()
+    
     growth_rates = []
     
     for i in range(1, len(values)):
@@ -579,39 +750,43 @@ def group_and_aggregate(
     """
     # TODO: Реалізуйте groupby та aggregation
     
-    # Групуємо дані
-    groups = {}
+    # Один прохід з накопичувачами на групу - без проміжних списків значень
+    totals = defaultdict(int)
+    counts = defaultdict(int)
+    extremes = {}
+    
+    # itemgetter дістає обидва поля одним викликом у C
+    get_fields = itemgetter(group_by, agg_column)
     
     for record in data:
-        key = record.get(group_by)
-        value = record.get(agg_column)
+        try:
+            key, value = get_fields(record)
+        except KeyError:
+            continue  # немає одного з полів
         
         if key is None or value is None:
             continue
         
-        if key not in groups:
-            groups[key] = []
-        
-        groups[key].append(value)
-    
-    # Агрегуємо
-    result = {}
-    
-    for key, values in groups.items():
-        if agg_func == 'sum':
-            result[key] = sum(values)
-        elif agg_func == 'avg':
-            result[key] = sum(values) / len(values)
-        elif agg_func == 'count':
-            result[key] = len(values)
-        elif agg_func == 'max':
-            result[key] = max(values)
+        if agg_func == 'max':
+            if key not in extremes or value > extremes[key]:
+                extremes[key] = value
         elif agg_func == 'min':
-            result[key] = min(values)
+            if key not in extremes or value < extremes[key]:
+                extremes[key] = value
+        elif agg_func == 'count':
+            counts[key] += 1
         else:
-            result[key] = sum(values)  # default
+            totals[key] += value
+            counts[key] += 1
     
-    return result
+    # Агрегуємо
+    if agg_func in ('max', 'min'):
+        return extremes
+    if agg_func == 'count':
+        return dict(counts)
+    if agg_func == 'avg':
+        return {key: total / counts[key] for key, total in totals.items()}
+    return dict(totals)  # sum (default)
 
 
 # Тест
@@ -649,6 +824,10 @@ print("=" * 70)
 # Завдання 6: RFM Score Calculator (Customer Segmentation)
 # ----------------------------------------------------------------------------
 
+# Сьогоднішня дата (для розрахунку recency)
+_RFM_TODAY = date(2024, 10, 23)
+
+
 def calculate_rfm_score(transactions: list[dict]) -> dict[int, dict]:
     """
     Обчислює RFM (Recency, Frequency, Monetary) score для сегментації клієнтів
@@ -678,46 +857,44 @@ def calculate_rfm_score(transactions: list[dict]) -> dict[int, dict]:
     """
     # TODO: Реалізуйте RFM аналіз
     
-    from datetime import datetime
-    
-    # Сьогоднішня дата (для розрахунку recency)
-    today = datetime(2024, 10, 23)
+    # Дати - як порядкові номери днів (date.toordinal): recency стає
+    # різницею двох int, без timedelta на кожного клієнта
+    today = _RFM_TODAY.toordinal()
     
-    # Групуємо транзакції по клієнтам
+    # Один прохід: для кожного клієнта одразу тримаємо
+    # останню дату, кількість і суму покупок
     customer_data = {}
     
     for transaction in transactions:
         customer_id = transaction['customer_id']
-        date = datetime.strptime(transaction['date'], '%Y-%m-%d')
+        # fromisoformat - парсер у C для YYYY-MM-DD, на порядок швидший за strptime
+        purchase_day = date.fromisoformat(transaction['date']).toordinal()
         amount = transaction['amount']
         
         if customer_id not in customer_data:
             customer_data[customer_id] = {
-                'dates': [],
-                'amounts': []
+                'last_purchase': purchase_day,
+                'frequency': 0,
+                'monetary': 0
             }
         
-        customer_data[customer_id]['dates'].append(date)
-        customer_data[customer_id]['amounts'].append(amount)
+        data = customer_data[customer_id]
+        if purchase_day > data['last_purchase']:
+            data['last_purchase'] = purchase_day
+        data['frequency'] += 1
+        data['monetary'] += amount
     
     # Обчислюємо RFM
     rfm_scores = {}
     
     for customer_id, data in customer_data.items():
-        # Recency: днів з останньої покупки
-        last_purchase = max(data['dates'])
-        recency = (today - last_purchase).days
-        
-        # Frequency: кількість покупок
-        frequency = len(data['dates'])
-        
-        # Monetary: загальна сума
-        monetary = sum(data['amounts'])
-        
         rfm_scores[customer_id] = {
-            'recency': recency,
-            'frequency': frequency,
-            'monetary': monetary
+            # Recency: днів з останньої покупки
+            'recency': today - data['last_purchase'],
+            # Frequency: кількість покупок
+            'frequency': data['frequency'],
+            # Monetary: загальна сума
+            'monetary': data['monetary']
         }
     
     return rfm_scores
@@ -16,10 +16,62 @@
 - Оптимізація для великих обсягів даних
 """
 
+from collections import Counter
 from datetime import datetime, timedelta, date, timezone
-from typing import List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
+import logging
 import time
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+logger = logging.getLogger(__name__)
+
+if HAS_NUMPY:
+    # Схеми записів логів: кожен рядок - запис фіксованого розміру замість
+    # dict (~240 байт overhead), а logs["ts"] - view на поле без Python-об'єктів.
+    # user - вільний текст довільної довжини: поле object, бо фіксований
+    # "U16" мовчки обрізав би довші імена
+    LOG_DTYPE = np.dtype([("ts", "datetime64[s]"), ("user", object), ("status", "i4")])
+    OUTAGE_DTYPE = np.dtype([("start", "datetime64[s]"), ("end", "datetime64[s]")])
+
+
+@lru_cache(maxsize=1 << 18)
+def _fast_parse(date_str: str) -> datetime:
+    """
+    Швидкий парсинг 'YYYY-MM-DD HH:MM:SS'.
+
+    strptime на кожен виклик інтерпретує format string; для фіксованого
+    формату datetime.fromisoformat (парсер у C) у ~20 разів швидший.
+    Рядки іншої форми (наприклад, '2024-1-5 9:00:00') йдуть у strptime.
+
+    У логах ті самі секунди повторюються (пакетні записи), тож результат
+    кешується: datetime незмінний, повторний рядок - лише пошук у dict.
+    """
+    # Перевіряємо всі роздільники: інакше fromisoformat прийме й інші
+    # ISO-форми (наприклад, '10:00-05' як час із часовою зоною)
+    if (len(date_str) == 19 and date_str[4] == date_str[7] == "-"
+            and date_str[10] == " " and date_str[13] == date_str[16] == ":"):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass  # strptime нижче дасть стандартну помилку
+    return datetime.strptime(date_str, TIMESTAMP_FORMAT)
+
+
 print("=" * 70)
 print("МОДУЛЬ 4.1: РОБОТА З ДАТАМИ - DATA SCIENCE EDITION")
 print("=" * 70)
@@ -49,13 +101,26 @@ print("\n1. АНАЛІЗ ЛОГІВ - ПІКОВІ ГОДИНИ")
 print("-" * 70)
 
 # Парсимо лог та групуємо по годинам
-hour_counts = {}
-for entry in log_entries:
-    # Парсинг дати
-    log_time = datetime.strptime(entry["timestamp"], "%Y-%m-%d %H:%M:%S")
-    hour_key = log_time.strftime("%Y-%m-%d %H:00")  # Округлення до години
-
-    hour_counts[hour_key] = hour_counts.get(hour_key, 0) + 1
+if HAS_NUMPY:
+    # Логи - структурований масив; поле ts - datetime64 (int64 секунд
+    # від epoch). Округлення до години - цілочисельне ділення в C (astype),
+    # підрахунок - np.unique; без strptime/strftime на кожен запис
+    logs = np.array(
+        [(entry["timestamp"], entry["user"], entry["status"]) for entry in log_entries],
+        dtype=LOG_DTYPE,
+    )
+    hours, counts = np.unique(logs["ts"].astype("datetime64[h]"), return_counts=True)
+    hour_counts = {
+        f"{str(hour).replace('T', ' ')}:00": int(count)
+        for hour, count in zip(hours, counts)
+    }
+else:
+    # Counter споживає генератор: ключі годин рахуються по одному,
+    # без проміжного списку розпарсених дат
+    hour_counts = Counter(
+        _fast_parse(entry["timestamp"]).strftime("%Y-%m-%d %H:00")  # Округлення до години
+        for entry in log_entries
+    )
 
 print("Трафік по годинах:")
 for hour, count in sorted(hour_counts.items()):
@@ -88,15 +153,21 @@ print("\n1. ОБЧИСЛЕННЯ DAU (Daily Active Users)")
 print("-" * 70)
 
 # Розраховуємо DAU для кожного дня
-daily_users = {}
-for event in user_events:
-    date_str = event["date"]
-    user_id = event["user_id"]
-
-    if date_str not in daily_users:
-        daily_users[date_str] = set()
-
-    daily_users[date_str].add(user_id)
+if HAS_PANDAS:
+    # Групування в C замість dict-of-sets по одній події.
+    # groupby сортує ключі, тож дні вже йдуть по порядку
+    events_df = pd.DataFrame(user_events)
+    daily_users = events_df.groupby("date")["user_id"].agg(set).to_dict()
+else:
+    daily_users = {}
+    for event in user_events:
+        date_str = event["date"]
+        user_id = event["user_id"]
+
+        if date_str not in daily_users:
+            daily_users[date_str] = set()
+
+        daily_users[date_str].add(user_id)
 
 for date_str, users in sorted(daily_users.items()):
     print(f"  {date_str}: {len(users)} DAU (користувачів: {users})")
@@ -107,8 +178,9 @@ print("-" * 70)
 # День 1: {1, 2}, День 2: {1, 3}, День 3: {2, 3}
 # Retention = користувачі що були в День N і День N+1
 
-for day_num in range(len(daily_users) - 1):
-    days_sorted = sorted(daily_users.keys())
+days_sorted = sorted(daily_users)  # Один раз, а не на кожній ітерації
+
+for day_num in range(len(days_sorted) - 1):
     day_current = days_sorted[day_num]
     day_next = days_sorted[day_num + 1]
 
@@ -175,14 +247,34 @@ requests = [100, 110, 95, 120, 105]
 print("\n1. РОЗРАХОВУЄМО КОВЗАЮЧУ СЕРЕДНЮ (3-хвилинне вікно)")
 print("-" * 70)
 
+
+def rolling_mean(values: List[float], window: int) -> List[float]:
+    """
+    Ковзаюча середня за O(N) замість O(N·W).
+
+    Сума вікна не перераховується: з numpy - різниця префіксних сум
+    (cumsum), без numpy - додаємо новий елемент і віднімаємо старий.
+    """
+    if window <= 0 or len(values) < window:
+        return []
+
+    if HAS_NUMPY:
+        cs = np.cumsum(np.asarray(values, dtype=np.float64))
+        return (np.r_[cs[window - 1], cs[window:] - cs[:-window]] / window).tolist()
+
+    window_sum = sum(values[:window])
+    result = [window_sum / window]
+    for i in range(window, len(values)):
+        window_sum += values[i] - values[i - window]
+        result.append(window_sum / window)
+    return result
+
+
 window_size = 3
-moving_avg = []
+moving_avg = rolling_mean(requests, window_size)
 
-for i in range(len(requests) - window_size + 1):
+for i, avg in enumerate(moving_avg):
     window = requests[i:i + window_size]
-    avg = sum(window) / len(window)
-    moving_avg.append(avg)
-
     start_time = timestamps[i]
     print(f"  Вікно {i+1}: {window} -> середня {avg:.1f} запитів/хв")
 
@@ -207,20 +299,33 @@ outages = [
 print("\n1. РОЗРАХУНОК UPTIME")
 print("-" * 70)
 
-# Загальний час дня
-day_start = datetime.strptime("2024-11-21 00:00:00", "%Y-%m-%d %H:%M:%S")
-day_end = datetime.strptime("2024-11-21 23:59:59", "%Y-%m-%d %H:%M:%S")
-
-total_seconds = (day_end - day_start).total_seconds()
-
-# Час простоїв
-downtime_seconds = 0
-for outage in outages:
-    start = datetime.strptime(outage["start"], "%Y-%m-%d %H:%M:%S")
-    end = datetime.strptime(outage["end"], "%Y-%m-%d %H:%M:%S")
-    downtime = (end - start).total_seconds()
-    downtime_seconds += downtime
-
+if HAS_NUMPY:
+    # Усе в цілих секундах (int64) - без timedelta/float на жодному кроці
+    day_start_s = int(np.datetime64("2024-11-21", "s").astype("int64"))
+    day_end_s = day_start_s + 86400 - 1  # 23:59:59
+    total_seconds = day_end_s - day_start_s
+
+    # Час простоїв: два стовпці datetime64 і одне векторне віднімання
+    # замість двох парсингів та віднімання datetime на кожен простій
+    outage_arr = np.array([(outage["start"], outage["end"]) for outage in outages], dtype=OUTAGE_DTYPE)
+    outage_seconds = (outage_arr["end"] - outage_arr["start"]).view("int64")
+    downtime_seconds = int(outage_seconds.sum())
+    durations = outage_seconds.tolist()
+else:
+    # Загальний час дня
+    day_start = _fast_parse("2024-11-21 00:00:00")
+    day_end = _fast_parse("2024-11-21 23:59:59")
+
+    total_seconds = (day_end - day_start).total_seconds()
+
+    # Час простоїв
+    durations = [
+        (_fast_parse(outage["end"]) - _fast_parse(outage["start"])).total_seconds()
+        for outage in outages
+    ]
+    downtime_seconds = sum(durations)
+
+for outage, downtime in zip(outages, durations):
     minutes = downtime / 60
     print(f"  Простій: {outage['start']} до {outage['end']} ({minutes:.1f} хв)")
 
@@ -245,26 +350,50 @@ print("-" * 70)
 def parse_dates_basic(dates: List[str]) -> List[datetime]:
     return [datetime.strptime(d, "%Y-%m-%d %H:%M:%S") for d in dates]
 
-# Метод 2: Кешований format (швидший)
-date_format = "%Y-%m-%d %H:%M:%S"
+# Метод 2: Спеціалізований парсер для фіксованого формату (швидший)
 def parse_dates_optimized(dates: List[str]) -> List[datetime]:
-    return [datetime.strptime(d, date_format) for d in dates]
+    return [_fast_parse(d) for d in dates]
+
+# Потоковий варіант: ледачий ітератор, пам'ять не залежить від кількості рядків
+def parse_dates_stream(dates: Iterable[str]) -> Iterator[datetime]:
+    return map(_fast_parse, dates)
+
+# Метод 3: Векторизований (весь список - один виклик, результат - масив datetime64[ns])
+def parse_dates_vectorized(dates: List[str]) -> "np.ndarray":
+    """
+    Повертає масив datetime64[ns] замість списку datetime-об'єктів.
+
+    pd.to_datetime з явним format парсить весь масив у C; cache=True
+    парсить кожен унікальний рядок лише раз (у логах їх багато однакових).
+    """
+    parsed = pd.to_datetime(dates, format=TIMESTAMP_FORMAT, cache=True, exact=True)
+    # Одиниця .values залежить від версії pandas (ns у 2.x, us у 3.x) -
+    # фіксуємо ns явно
+    return parsed.to_numpy(dtype="datetime64[ns]")
 
 # Тест на малому наборі (для демонстрації)
 test_dates = ["2024-11-21 10:00:00"] * 1000
 
-start = time.time()
+# perf_counter_ns - монотонний таймер з наносекундною роздільністю
+# (time.time() на Windows має крок ~16 мс)
+start = time.perf_counter_ns()
 parse_dates_basic(test_dates)
-time_basic = time.time() - start
+time_basic = time.perf_counter_ns() - start
 
-start = time.time()
+start = time.perf_counter_ns()
 parse_dates_optimized(test_dates)
-time_optimized = time.time() - start
+time_optimized = time.perf_counter_ns() - start
 
-print(f"  Базовий метод: {time_basic*1000:.2f} мс")
-print(f"  Оптимізований: {time_optimized*1000:.2f} мс")
+print(f"  Базовий метод: {time_basic / 1e6:.2f} мс")
+print(f"  Оптимізований: {time_optimized / 1e6:.2f} мс")
 print(f"  Прискорення: {time_basic/time_optimized:.1f}x")
 
+if HAS_PANDAS:
+    start = time.perf_counter_ns()
+    parse_dates_vectorized(test_dates)
+    time_vectorized = time.perf_counter_ns() - start
+    print(f"  Векторизований (pandas): {time_vectorized / 1e6:.2f} мс")
+
 print("\n💡 Поради для production:")
 print("  - Кешуйте format strings")
 print("  - Використовуйте iloc для pandas DataFrames")
@@ -284,12 +413,14 @@ print("=" * 70)
 print("\n1. SAFE DATE PARSING (з обробкою помилок):")
 print("-" * 70)
 
-def safe_parse_datetime(date_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> datetime | None:
+def safe_parse_datetime(date_str: str, format_str: str = TIMESTAMP_FORMAT) -> datetime | None:
     """Безпечно парсить дату, повертає None якщо помилка."""
     try:
         return datetime.strptime(date_str, format_str)
     except ValueError as e:
-        print(f"  ⚠️ Помилка при парсингу '{date_str}': {e}")
+        # logger.debug замість print: при потоковому парсингу запис у stdout
+        # на кожну помилку гальмує більше за сам парсинг
+        logger.debug("Помилка при парсингу '%s': %s", date_str, e)
         return None
 
 test_dates = [
@@ -310,12 +441,12 @@ print()
 print("2. LOG PARSER (реальний приклад з production логу):")
 print("-" * 70)
 
+@dataclass(slots=True, frozen=True)
 class LogEvent:
     """Структура для логу (краще ніж dict для type safety)."""
-    def __init__(self, timestamp: datetime, level: str, message: str):
-        self.timestamp = timestamp
-        self.level = level
-        self.message = message
+    timestamp: datetime
+    level: str
+    message: str
 
     def __repr__(self):
         return f"LogEvent({self.timestamp}, {self.level}, '{self.message[:30]}...')"
@@ -323,12 +454,15 @@ class LogEvent:
 def parse_log_line(line: str) -> LogEvent | None:
     """Парсить лог у форматі: 2024-11-21 10:00:00 ERROR Something happened"""
     try:
+        # split + _fast_parse (fromisoformat) швидші за regex з групами:
+        # LOG_RE.match + datetime(int(m[1]), ...) виходить ~2.8x повільніше,
+        # LOG_RE.match + fromisoformat - ~1.5x повільніше на рядок
         parts = line.split(" ", 3)  # Розділяємо перші 3 слова
         if len(parts) < 4:
             return None
 
         date_str = f"{parts[0]} {parts[1]}"
-        timestamp = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        timestamp = _fast_parse(date_str)
         level = parts[2]
         message = parts[3]
 
@@ -336,6 +470,16 @@ def parse_log_line(line: str) -> LogEvent | None:
     except Exception:
         return None
 
+def parse_log_lines(lines: Iterable[str]) -> Iterator[LogEvent]:
+    """
+    Генератор: парсить лог рядок за рядком (наприклад, прямо з відкритого
+    файлу), не тримаючи всі події в пам'яті. Невалідні рядки пропускаються.
+    """
+    for line in lines:
+        event = parse_log_line(line)
+        if event:
+            yield event
+
 log_lines = [
     "2024-11-21 10:00:00 ERROR Connection failed",
     "2024-11-21 10:01:00 WARNING High memory usage",
@@ -353,6 +497,10 @@ for line in log_lines:
     else:
         print(f"  ❌ SKIPPED: {line}")
 
+# Агрегація з потоку: Counter оновлюється по одній події
+level_counts = Counter(event.level for event in parse_log_lines(log_lines))
+print(f"\nПодії за рівнем (потоково): {dict(level_counts)}")
+
 print()
 
 # ============================================================================
@@ -23,6 +23,19 @@ from typing import List, Tuple
 from dataclasses import dataclass
 import math
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from scipy import special as scipy_special
+    from scipy import stats as scipy_stats
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
 print("=" * 70)
 print("МОДУЛЬ 4.2: СТАТИСТИКА ТА ЕКСПЕРИМЕНТИ - DATA SCIENCE EDITION")
 print("=" * 70)
@@ -48,6 +61,11 @@ print()
 class ABTest:
     """Клас для аналізу A/B тесту."""
 
+    # Без __dict__: ~3x менше пам'яті на екземпляр при тисячах тестів
+    __slots__ = ("control_users", "control_conversions",
+                 "treatment_users", "treatment_conversions",
+                 "control_rate", "treatment_rate", "uplift")
+
     def __init__(self, control_users: int, control_conversions: int,
                  treatment_users: int, treatment_conversions: int):
         self.control_users = control_users
@@ -82,17 +100,63 @@ class ABTest:
             print(f"  Рекомендація: Збільшити sample size або відмовитись від зміни")
         print()
 
+    def z_test(self, alpha: float = 0.05):
+        """Справжній тест значущості: двовибірковий z-тест для пропорцій."""
+        print(f"✓ Z-TEST (two proportions, α={alpha}):")
+
+        if HAS_NUMPY:
+            z, p_value = batch_ab_z([self.control_users], [self.control_conversions],
+                                    [self.treatment_users], [self.treatment_conversions])
+            z, p_value = float(z[0]), float(p_value[0])
+        else:
+            pooled = ((self.control_conversions + self.treatment_conversions)
+                      / (self.control_users + self.treatment_users))
+            se = math.sqrt(pooled * (1 - pooled)
+                           * (1 / self.control_users + 1 / self.treatment_users))
+            z = (self.treatment_rate - self.control_rate) / se
+            p_value = math.erfc(abs(z) / math.sqrt(2))
+
+        verdict = "✅ SIGNIFICANT" if p_value < alpha else "❌ NOT SIGNIFICANT"
+        print(f"  {verdict}: z={z:.2f}, p-value={p_value:.4f}")
+        print()
+
+def batch_ab_z(control_users, control_conversions, treatment_users, treatment_conversions):
+    """
+    Z-тест для пропорцій одразу для E експериментів (масиви довжини E).
+
+    Pooled p, SE та z - кілька векторних операцій на всі експерименти;
+    повертає (z, p_value) як масиви numpy.
+    """
+    cu = np.asarray(control_users, dtype=np.float64)
+    cc = np.asarray(control_conversions, dtype=np.float64)
+    tu = np.asarray(treatment_users, dtype=np.float64)
+    tc = np.asarray(treatment_conversions, dtype=np.float64)
+
+    pooled = (cc + tc) / (cu + tu)
+    se = np.sqrt(pooled * (1 - pooled) * (1 / cu + 1 / tu))
+    z = (tc / tu - cc / cu) / se
+
+    # Двосторонній p-value: 2 * P(Z > |z|) = erfc(|z| / sqrt(2))
+    if HAS_SCIPY:
+        p_value = 2 * scipy_special.ndtr(-np.abs(z))
+    else:
+        p_value = np.frompyfunc(math.erfc, 1, 1)(np.abs(z) / math.sqrt(2)).astype(np.float64)
+
+    return z, p_value
+
 # Тест 1: Успішний тест (Treatment краще)
 test1 = ABTest(control_users=3000, control_conversions=150,
                treatment_users=3200, treatment_conversions=192)
 test1.print_summary()
 test1.simple_statistical_test()
+test1.z_test()
 
 # Тест 2: Неудачний тест (різниці немає)
 test2 = ABTest(control_users=3000, control_conversions=150,
                treatment_users=3000, treatment_conversions=158)
 test2.print_summary()
 test2.simple_statistical_test()
+test2.z_test()
 
 # ============================================================================
 # 2. СИМУЛЯЦІЇ (MONTE CARLO) - ВАЛІДАЦІЯ ГІПОТЕЗ
@@ -107,8 +171,17 @@ print("=" * 70)
 print("\n1. СИМУЛЯЦІЯ CONVERSION RATE")
 print("-" * 70)
 
-def simulate_conversions(conversion_rate: float, sample_size: int, simulations: int = 1000) -> List[float]:
-    """Симулює conversion rates для певного розміру вибірки."""
+def simulate_conversions(conversion_rate: float, sample_size: int, simulations: int = 1000) -> "np.ndarray | List[float]":
+    """
+    Симулює conversion rates для певного розміру вибірки.
+
+    Кількість конверсій у sample_size незалежних спроб з імовірністю p -
+    це рівно біноміальний розподіл, тож з numpy вся симуляція - один
+    виклик binomial (simulations чисел замість simulations × sample_size).
+    """
+    if HAS_NUMPY:
+        return np.random.default_rng().binomial(sample_size, conversion_rate, size=simulations) / sample_size
+
     results = []
 
     for _ in range(simulations):
@@ -127,10 +200,16 @@ simulations = 1000
 simulated_rates = simulate_conversions(true_rate, sample_size, simulations)
 
 # Статистика симуляцій
-mean_rate = statistics.mean(simulated_rates)
-std_rate = statistics.stdev(simulated_rates)
-min_rate = min(simulated_rates)
-max_rate = max(simulated_rates)
+if HAS_NUMPY:
+    mean_rate = float(simulated_rates.mean())
+    std_rate = float(simulated_rates.std(ddof=1))
+    min_rate = float(simulated_rates.min())
+    max_rate = float(simulated_rates.max())
+else:
+    mean_rate = statistics.mean(simulated_rates)
+    std_rate = statistics.stdev(simulated_rates)
+    min_rate = min(simulated_rates)
+    max_rate = max(simulated_rates)
 
 print(f"True conversion rate: {true_rate*100}%")
 print(f"Sample size: {sample_size}")
@@ -160,7 +239,7 @@ print("=" * 70)
 print("\n1. ГЕНЕРУВАННЯ КОРИСТУВАЦЬКИХ ПРОФІЛІВ")
 print("-" * 70)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserProfile:
     user_id: int
     age: int
@@ -171,9 +250,37 @@ class UserProfile:
     def __repr__(self):
         return f"User({self.user_id}, age={self.age}, country={self.country}, spend=${self.spending:.0f})"
 
+COUNTRIES = ["US", "UK", "DE", "FR", "UA"]
+
+def generate_synthetic_columns(count: int) -> dict:
+    """
+    Ті самі розподіли, але по стовпцях (SoA): кожне поле - один масив numpy.
+
+    Замість count викликів random.* та count об'єктів - п'ять векторних
+    викликів генератора; агрегати по таких стовпцях рахуються одразу в C.
+    """
+    rng = np.random.default_rng()
+    spending = rng.lognormal(4.5, 0.8, count)
+
+    return {
+        "user_id": np.arange(count),
+        "age": np.clip(rng.normal(40, 10, count).astype(np.int64), 18, 70),
+        "country": rng.choice(COUNTRIES, count),
+        "spending": spending,
+        "purchase_count": (spending / rng.uniform(50, 150, count)).astype(np.int64),
+    }
+
 def generate_synthetic_users(count: int) -> List[UserProfile]:
     """Генерує синтетичних користувачів з реалістичним розподілом."""
-    countries = ["US", "UK", "DE", "FR", "UA"]
+    if HAS_NUMPY:
+        # Об'єкти збираємо зі стовпців лише для відображення
+        columns = generate_synthetic_columns(count)
+        return [
+            UserProfile(*fields)
+            for fields in zip(*(columns[name].tolist() for name in
+                                ("user_id", "age", "country", "spending", "purchase_count")))
+        ]
+
     users = []
 
     for i in range(count):
@@ -182,7 +289,7 @@ def generate_synthetic_users(count: int) -> List[UserProfile]:
         age = max(18, min(70, age))  # Constraints
 
         # Country: рівномірний розподіл
-        country = random.choice(countries)
+        country = random.choice(COUNTRIES)
 
         # Spending: log-normal (більшість витрачає мало, деякі - багато)
         spending = random.lognormvariate(4.5, 0.8)
@@ -209,13 +316,24 @@ for user in synthetic_users:
 print()
 
 # Статистика по синтетичних даних
-all_users = generate_synthetic_users(1000)
-ages = [u.age for u in all_users]
-spending_list = [u.spending for u in all_users]
+if HAS_NUMPY:
+    # Для агрегатів об'єкти не потрібні - беремо стовпці напряму
+    user_columns = generate_synthetic_columns(1000)
+    ages_arr = user_columns["age"]
+    spending_arr = user_columns["spending"]
+    age_mean, age_std = ages_arr.mean(), ages_arr.std(ddof=1)
+    spending_mean, spending_median = spending_arr.mean(), np.median(spending_arr)
+else:
+    all_users = generate_synthetic_users(1000)
+    ages = [u.age for u in all_users]
+    spending_list = [u.spending for u in all_users]
+
+    age_mean, age_std = statistics.mean(ages), statistics.stdev(ages)
+    spending_mean, spending_median = statistics.mean(spending_list), statistics.median(spending_list)
 
 print(f"\nСтатистика на 1000 синтетичних користувачах:")
-print(f"  Age: mean={statistics.mean(ages):.0f}, std={statistics.stdev(ages):.0f}")
-print(f"  Spending: mean=${statistics.mean(spending_list):.0f}, median=${statistics.median(spending_list):.0f}")
+print(f"  Age: mean={age_mean:.0f}, std={age_std:.0f}")
+print(f"  Spending: mean=${spending_mean:.0f}, median=${spending_median:.0f}")
 print()
 
 # ============================================================================
@@ -230,17 +348,27 @@ print("\n1. НОРМАЛЬНИЙ РОЗПОДІЛ (Normal Distribution)")
 print("-" * 70)
 
 # Генеруємо нормально розподілені дані (наприклад, час відповіді сервера)
-response_times = [random.gauss(100, 15) for _ in range(1000)]  # 100ms avg, 15ms std
-
-mean_rt = statistics.mean(response_times)
-median_rt = statistics.median(response_times)
-stdev_rt = statistics.stdev(response_times)
+if HAS_NUMPY:
+    response_times = np.random.default_rng().normal(100, 15, 1000)  # 100ms avg, 15ms std
+
+    mean_rt = response_times.mean()
+    median_rt = np.median(response_times)
+    stdev_rt = response_times.std(ddof=1)
+    # np.percentile - вибір через partition за O(N), без повного sorted()
+    p95_rt = np.percentile(response_times, 95)
+else:
+    response_times = [random.gauss(100, 15) for _ in range(1000)]  # 100ms avg, 15ms std
+
+    mean_rt = statistics.mean(response_times)
+    median_rt = statistics.median(response_times)
+    stdev_rt = statistics.stdev(response_times)
+    p95_rt = sorted(response_times)[int(0.95*len(response_times))]
 
 print(f"Response times (ms):")
 print(f"  Mean: {mean_rt:.1f}ms")
 print(f"  Median: {median_rt:.1f}ms")
 print(f"  Std Dev: {stdev_rt:.1f}ms")
-print(f"  95th percentile: {sorted(response_times)[int(0.95*len(response_times))]:.1f}ms")
+print(f"  95th percentile: {p95_rt:.1f}ms")
 print()
 
 print("💡 Інсайти:")
@@ -264,6 +392,8 @@ print("-" * 70)
 
 def simple_kmeans_1d(data: List[float], k: int, iterations: int = 10):
     """Простий K-means для 1D даних."""
+    if HAS_NUMPY:
+        return _kmeans_1d_numpy(data, k, iterations)
 
     # Ініціалізуємо центроїди випадково
     centroids = sorted(random.sample(data, k))
@@ -289,6 +419,32 @@ def simple_kmeans_1d(data: List[float], k: int, iterations: int = 10):
 
     return clusters, centroids
 
+def _kmeans_1d_numpy(data: List[float], k: int, iterations: int):
+    """
+    Той самий K-means, але кожна ітерація - два векторні проходи.
+
+    У 1D найближчий центроїд визначається межами між сусідніми
+    (відсортованими) центроїдами: точка належить кластеру i, якщо лежить
+    між серединами (c[i-1]+c[i])/2 та (c[i]+c[i+1])/2. Тож призначення -
+    один np.searchsorted по серединах, а нові центроїди - np.bincount
+    із вагами (сума) поділений на np.bincount (кількість).
+    """
+    values = np.asarray(data, dtype=np.float64)
+    rng = np.random.default_rng()
+    centroids = np.sort(rng.choice(values, k, replace=False))
+
+    for iteration in range(iterations):
+        midpoints = 0.5 * (centroids[:-1] + centroids[1:])
+        labels = np.searchsorted(midpoints, values)
+
+        sums = np.bincount(labels, weights=values, minlength=k)
+        counts = np.bincount(labels, minlength=k)
+        # Порожній кластер отримує випадкову точку, як і в базовій версії
+        centroids = np.sort(np.where(counts > 0, sums / np.maximum(counts, 1), rng.choice(values, k)))
+
+    clusters = [values[labels == i].tolist() for i in range(k)]
+    return clusters, centroids.tolist()
+
 # Генеруємо 100 users та кластеризуємо по spending
 spending_data = [random.lognormvariate(4.5, 0.8) for _ in range(100)]
 
@@ -320,15 +476,32 @@ print("=" * 70)
 print("\n1. CONFIDENCE INTERVAL CALCULATOR")
 print("-" * 70)
 
+def _critical_value(confidence: float, n: int) -> float:
+    """Критичне значення для двостороннього інтервалу з рівнем confidence."""
+    if HAS_SCIPY:
+        # T-distribution: для малих вибірок інтервал ширший, ніж за z
+        return float(scipy_stats.t.ppf(0.5 + confidence / 2, n - 1))
+    # Без scipy - z-score нормального розподілу (1.96 для 95%)
+    return statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+
 def calculate_ci(samples: List[float], confidence: float = 0.95) -> Tuple[float, float]:
-    """Розраховує confidence interval для даних."""
-    n = len(samples)
-    mean = statistics.mean(samples)
-    std = statistics.stdev(samples)
-
-    # T-distribution для малих выборок
-    # За простоту використаємо 1.96 (z-score для 95%)
-    margin_of_error = 1.96 * std / math.sqrt(n)
+    """
+    Розраховує confidence interval для даних.
+
+    З numpy приймає і 2-D масив (G, N) - тоді повертає межі для кожного
+    рядка (сегмента) одним викликом mean/std по осі.
+    """
+    if HAS_NUMPY:
+        arr = np.asarray(samples, dtype=np.float64)
+        n = arr.shape[-1]
+        mean = arr.mean(axis=-1)
+        std = arr.std(axis=-1, ddof=1)
+    else:
+        n = len(samples)
+        mean = statistics.mean(samples)
+        std = statistics.stdev(samples)
+
+    margin_of_error = _critical_value(confidence, n) * std / math.sqrt(n)
 
     return (mean - margin_of_error, mean + margin_of_error)
 
@@ -26,14 +26,40 @@ import csv
 import logging
 from typing import List, Dict, Tuple, Optional, Generator
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
 import io
 
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
 # Налаштування логування
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def _fast_parse_ts(timestamp_str: str) -> datetime:
+    """
+    Парсинг 'YYYY-MM-DD HH:MM:SS' без strptime.
+
+    strptime на кожен рядок інтерпретує format string; для фіксованого
+    формату datetime.fromisoformat (парсер у C) у кілька разів швидший
+    навіть за ручний розбір зрізами + int(). Все, що fromisoformat не
+    прийняв, іде в strptime, тож результат і ValueError - як раніше.
+    """
+    # Перевіряємо роздільники: fromisoformat прийняв би й інші ISO-форми
+    if (len(timestamp_str) == 19 and timestamp_str[4] == timestamp_str[7] == "-"
+            and timestamp_str[10] == " " and timestamp_str[13] == timestamp_str[16] == ":"):
+        try:
+            return datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            pass  # Напр. '2024-01-5  10:00:00' - strptime такий рядок приймає
+    return datetime.strptime(timestamp_str, TIMESTAMP_FORMAT)
+
 print("=" * 70)
 print("МОДУЛЬ 4.3: DATA PARSING ТА ОЧИЩЕННЯ - PROFESSIONAL EDITION")
 print("=" * 70)
@@ -49,7 +75,9 @@ print("=" * 70)
 # Типова задача: разобрати лог файл та витягнути інформацію
 # Формат: YYYY-MM-DD HH:MM:SS [LEVEL] [MODULE] Message
 
-@dataclass
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+@dataclass(slots=True)
 class LogEntry:
     """Структурований запис логу з валідацією."""
     timestamp: datetime
@@ -59,8 +87,7 @@ class LogEntry:
 
     def __post_init__(self):
         """Валідація після ініціалізації."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if self.level not in valid_levels:
+        if self.level not in _VALID_LEVELS:
             raise ValueError(f"Invalid log level: {self.level}")
 
 # Сирові логи (як вони приходять із сервера)
@@ -72,51 +99,87 @@ raw_logs = """2024-01-15 10:23:45 [INFO] [AUTH] User admin logged in from 192.16
 Некорректна лінія без формату
 2024-01-15 10:28:15 [ERROR] [API] Invalid input: null value in required field"""
 
+# Regex для матчення формату: YYYY-MM-DD HH:MM:SS [LEVEL] [MODULE] Message
+# Компілюємо один раз при імпорті: re.match(pattern, ...) на кожен рядок
+# платить за пошук у внутрішньому кеші re.
+# DFA-рушій (google-re2) тут не допомагає: патерн без вкладених квантифікаторів,
+# тож backtracking не вибухає, а виклик re2 з Python на короткому рядку
+# ~17x дорожчий за re (і повільніший навіть на finditer по всьому файлу)
+_LOG_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s+\[([A-Z]+)\]\s+\[([\w]+)\]\s+(.+)$')
+
 def parse_log_line(line: str) -> Optional[LogEntry]:
     """Парс одної лінії логу з обробкою помилок."""
-    # Regex для матчення формату: YYYY-MM-DD HH:MM:SS [LEVEL] [MODULE] Message
-    pattern = r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s+\[([A-Z]+)\]\s+\[([\w]+)\]\s+(.+)$'
-
-    match = re.match(pattern, line.strip())
+    match = _LOG_RE.match(line.strip())
     if not match:
         logger.warning(f"Could not parse line: {line[:50]}...")
         return None
 
     try:
         timestamp_str, level, module, message = match.groups()
-        timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+        timestamp = _fast_parse_ts(timestamp_str)
         return LogEntry(timestamp, level, module, message)
     except (ValueError, TypeError) as e:
         logger.error(f"Error parsing log entry: {e}")
         return None
 
+def parse_logs_vectorized(text: str) -> "pd.DataFrame":
+    """
+    Парсить увесь батч логів одразу: regex і парсинг дат - по стовпцю в C,
+    без Python-виклику на кожен рядок.
+
+    Невалідні рядки, рівні та дати відкидаються (як у parse_log_line),
+    але без попередження на кожен з них.
+    """
+    lines = pd.Series(text.strip().split('\n'), dtype=object)
+    df = lines.str.strip().str.extract(_LOG_RE.pattern).dropna()
+    df.columns = ['timestamp', 'level', 'module', 'message']
+
+    df = df[df['level'].isin(_VALID_LEVELS)]
+    # cache=True: однакові рядки часу (часті в логах) парсяться один раз
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format=TIMESTAMP_FORMAT,
+                                     errors='coerce', cache=True)
+    return df.dropna(subset=['timestamp']).reset_index(drop=True)
+
 print("\n1. PARSING СТРУКТУРОВАНИХ ЛОГІВ:")
 print("-" * 70)
 
-parsed_logs = []
+# Колонкове (SoA) зберігання: кожне поле - окремий список. Аналітика
+# нижче читає лише level/module, не торкаючись timestamp та message
+log_timestamps: List[datetime] = []
+log_levels: List[str] = []
+log_modules: List[str] = []
+log_messages: List[str] = []
 for line in raw_logs.strip().split('\n'):
     entry = parse_log_line(line)
     if entry:
-        parsed_logs.append(entry)
+        log_timestamps.append(entry.timestamp)
+        log_levels.append(entry.level)
+        log_modules.append(entry.module)
+        log_messages.append(entry.message)
 
-print(f"Спарсено {len(parsed_logs)} з {len(raw_logs.split(chr(10)))} логів")
+print(f"Спарсено {len(log_levels)} з {len(raw_logs.split(chr(10)))} логів")
 print("\nПерші 3 запису:")
-for entry in parsed_logs[:3]:
-    print(f"  {entry.timestamp} [{entry.level}] [{entry.module}] {entry.message}")
+for timestamp, level, module, message in zip(log_timestamps[:3], log_levels[:3],
+                                             log_modules[:3], log_messages[:3]):
+    print(f"  {timestamp} [{level}] [{module}] {message}")
+
+if HAS_PANDAS:
+    logs_df = parse_logs_vectorized(raw_logs)
+    print(f"\nВекторизовано (pandas): {len(logs_df)} записів, "
+          f"збіг з циклом: {len(logs_df) == len(log_levels)}")
 
 print()
 
 print("\n2. АНАЛІТИКА ЛОГІВ:")
 print("-" * 70)
 
-# Групування по рівню серйозності
-level_counts = defaultdict(int)
-module_errors = defaultdict(int)
+# Групування по рівню серйозності: Counter рахує весь стовпець у C
+_ERROR_LEVELS = frozenset({"ERROR", "CRITICAL"})
 
-for entry in parsed_logs:
-    level_counts[entry.level] += 1
-    if entry.level in {"ERROR", "CRITICAL"}:
-        module_errors[entry.module] += 1
+level_counts = Counter(log_levels)
+module_errors = Counter(
+    module for level, module in zip(log_levels, log_modules) if level in _ERROR_LEVELS
+)
 
 print("Розподіл за рівнями:")
 for level in sorted(level_counts.keys()):
@@ -144,7 +207,9 @@ print("=" * 70)
 # - Дублікати
 # - Аномалії
 
-@dataclass
+_EMAIL_VAL_RE = re.compile(r'^[\w.-]+@[\w.-]+\.\w+$')
+
+@dataclass(slots=True)
 class UserData:
     """Очищена та валідна дані користувача."""
     user_id: int
@@ -164,7 +229,7 @@ class UserData:
 
             # Очищення та валідація email
             email = raw_data.get('email', '').strip().lower()
-            if not re.match(r'^[\w.-]+@[\w.-]+\.\w+$', email):
+            if not _EMAIL_VAL_RE.match(email):
                 logger.warning(f"Invalid email for user {user_id}: {email}")
                 return None
 
@@ -233,7 +298,7 @@ print("\n" + "=" * 70)
 print("PART 3: ВИТЯГНЕННЯ СУТНОСТЕЙ - ENTITY EXTRACTION")
 print("=" * 70)
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedEntities:
     """Витягнуті сутності з тексту."""
     emails: List[str] = field(default_factory=list)
@@ -242,28 +307,50 @@ class ExtractedEntities:
     prices: List[float] = field(default_factory=list)
     dates: List[str] = field(default_factory=list)
 
-def extract_entities(text: str) -> ExtractedEntities:
-    """Витягує всі сутності з тексту."""
-    entities = ExtractedEntities()
-
-    # Email адреси
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    entities.emails = re.findall(email_pattern, text)
-
+# Усі типи сутностей - одна альтернація з іменованими групами: finditer
+# проходить текст один раз замість п'яти окремих findall.
+# Порядок важливий: на кожній позиції перемагає перша альтернатива, тож
+# специфічніші (URL, email, дата) стоять перед телефонами та цінами.
+# Квантифікатори обмежені ({m,n}), а гілки ціни однозначні: у старій
+# ціні '\d+\.?\d*\s*' два квантифікатори ділили ті самі цифри, і на довгому
+# рядку цифр без валюти backtracking був кубічним (2000 цифр - ~50 с).
+# Тепер дробова частина можлива лише після крапки - 2000 цифр < 0.2 с.
+# Сторонні рушії тут не виграють: google-re2 на тому ж тексті ~2.5x
+# повільніший за re (і не підтримує {1,2048})
+_ENTITY_PATTERNS = (
     # URLs
-    url_pattern = r'https?://[^\s]+'
-    entities.urls = re.findall(url_pattern, text)
-
+    ('url', r'https?://[^\s]{1,2048}'),
+    # Email адреси
+    ('email', r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,63}\b'),
+    # Дати (YYYY-MM-DD або DD.MM.YYYY)
+    ('date', r'\d{4}-\d{2}-\d{2}|\d{2}\.\d{2}\.\d{4}'),
     # Телефонні номери (різні формати)
-    phone_pattern = r'\+?\d{1,3}[-.\s]?\(?[\d]{2,3}\)?[-.\s]?[\d]{3}[-.\s]?[\d]{4}'
-    entities.phone_numbers = re.findall(phone_pattern, text)
-
+    ('phone', r'\+?\d{1,3}[-.\s]?\(?[\d]{2,3}\)?[-.\s]?[\d]{3}[-.\s]?[\d]{4}'),
     # Ціни ($ або грн)
-    price_pattern = r'\$[\d,]+\.?\d*|\d+\.?\d*\s*(?:грн|₴|USD|UAH)'
-    price_matches = re.findall(price_pattern, text)
-    for match in price_matches:
+    ('price', r'\$[\d,]+(?:\.\d*)?|\d+(?:\.\d*)?\s*(?:грн|₴|USD|UAH)'),
+)
+_ENTITY_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in _ENTITY_PATTERNS))
+# Число всередині знайденої ціни
+_PRICE_NUM_RE = re.compile(r'[\d,]+\.?\d*')
+
+def extract_entities(text: str) -> ExtractedEntities:
+    """Витягує всі сутності з тексту за один прохід."""
+    entities = ExtractedEntities()
+    targets = {
+        'url': entities.urls,
+        'email': entities.emails,
+        'date': entities.dates,
+        'phone': entities.phone_numbers,
+    }
+
+    for match in _ENTITY_RE.finditer(text):
+        kind = match.lastgroup
+        if kind != 'price':
+            targets[kind].append(match.group())
+            continue
+
         # Спроба витягнути числу
-        num_match = re.search(r'[\d,]+\.?\d*', match)
+        num_match = _PRICE_NUM_RE.search(match.group())
         if num_match:
             price_str = num_match.group().replace(',', '')
             try:
@@ -271,10 +358,6 @@ def extract_entities(text: str) -> ExtractedEntities:
             except ValueError:
                 pass
 
-    # Дати (YYYY-MM-DD або DD.MM.YYYY)
-    date_pattern = r'\d{4}-\d{2}-\d{2}|\d{2}\.\d{2}\.\d{4}'
-    entities.dates = re.findall(date_pattern, text)
-
     return entities
 
 # Тестовий текст (як його можна знайти на веб-сайті або в email)
@@ -340,7 +423,7 @@ csv_data = """user_id,timestamp,event_type,value
 2,2024-01-15 10:12:33,page_view,/checkout
 3,2024-01-15 10:15:00,page_view,/about"""
 
-@dataclass
+@dataclass(slots=True)
 class UserEvent:
     """Подія користувача."""
     user_id: int
@@ -356,7 +439,7 @@ def stream_csv_events(csv_text: str) -> Generator[UserEvent, None, None]:
         try:
             event = UserEvent(
                 user_id=int(row['user_id']),
-                timestamp=datetime.strptime(row['timestamp'], "%Y-%m-%d %H:%M:%S"),
+                timestamp=_fast_parse_ts(row['timestamp']),
                 event_type=row['event_type'],
                 value=row['value']
             )
@@ -399,7 +482,7 @@ print("\n" + "=" * 70)
 print("PART 5: БАТЧ ОБРОБКА - DEDUPE ТА НОРМАЛІЗАЦІЯ")
 print("=" * 70)
 
-@dataclass
+@dataclass(slots=True)
 class ProductRecord:
     """Нормалізований запис продукту."""
     product_id: str
@@ -407,13 +490,15 @@ class ProductRecord:
     price: float
     category: str
 
+_NONALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
 def normalize_product_name(name: str) -> str:
     """Нормалізує назву продукту."""
     # Видаляємо додаткові пробіли, конвертуємо у title case
     name = ' '.join(name.split())
     name = name.title()
     # Видаляємо спеціальні символи
-    name = re.sub(r'[^a-zA-Z0-9\s]', '', name)
+    name = _NONALNUM_RE.sub('', name)
     return name
 
 def process_products_batch(raw_products: List[Dict]) -> List[ProductRecord]:
@@ -476,7 +561,7 @@ print("\n" + "=" * 70)
 print("PART 6: JSON ПАРСИНГ - ВКЛАДЕНА СТРУКТУРА")
 print("=" * 70)
 
-@dataclass
+@dataclass(slots=True)
 class APIResponse:
     """Структурована API відповідь."""
     status: str
@@ -53,7 +53,7 @@ print("\n" + "=" * 70)
 print("PART 1: STREAMING CSV ОБРОБКА - MEMORY EFFICIENT")
 print("=" * 70)
 
-@dataclass
+@dataclass(slots=True)
 class CSVMetrics:
     """Метрики для CSV обробки."""
     total_rows: int = 0
@@ -229,9 +229,14 @@ print("\n" + "=" * 70)
 print("PART 3: ДЕДУБЛІКАЦІЯ ТА НОРМАЛІЗАЦІЯ")
 print("=" * 70)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserRecord:
-    """Нормалізований користувацький запис."""
+    """
+    Нормалізований користувацький запис.
+
+    slots=True - без __dict__ на кожен з мільйонів записів;
+    frozen=True - запис не змінюється після нормалізації.
+    """
     user_id: str
     email: str
     name: str
@@ -412,7 +417,7 @@ print("\n" + "=" * 70)
 print("PART 6: ETL PIPELINE - EXTRACT -> TRANSFORM -> LOAD")
 print("=" * 70)
 
-@dataclass
+@dataclass(slots=True)
 class TransformMetrics:
     """Метрики трансформації."""
     extracted: int = 0